@@ -0,0 +1,3 @@
+from logger.log_config import ALERT_LEVEL, CustomLogger, get_logger, setup_logger, shutdown_logger
+
+__all__ = ["ALERT_LEVEL", "CustomLogger", "get_logger", "setup_logger", "shutdown_logger"]
@@ -6,22 +6,43 @@ roteamento para múltiplos handlers e tratamentos de alertas especializados.
 
 Caracteriscitas Principais:
 - Níveis customizados (INFO, ALERT, WARNING, ERROR, CRITICAL)
-- Saída colorida para console
+- Saída colorida para console (desativada fora de TTY ou com NO_COLOR)
 - Rotação diária de arquivos de log
 - Arquivo separado para alertas críticos
 - Formação consistente para análise automatizada
+- Escrita em background (QueueHandler + QueueListener) para não bloquear o chamador
+
+Obtenha o logger uma vez no nível do módulo (`logger = get_logger(__name__)`)
+em vez de chamar `get_logger` dentro de laços. O nome é aninhado sob
+`InsiderCrypto`, então o logger herda os handlers de `setup_logger` mesmo
+quando obtido antes dele.
 """
 
+import atexit
+import functools
 import logging
+import queue
 import sys
 import os
+import threading
+import time
 from pathlib import Path
-from logging.handlers import TimedRotatingFileHandler
+from logging.handlers import (
+    BaseRotatingHandler,
+    QueueHandler,
+    QueueListener,
+    SysLogHandler,
+    TimedRotatingFileHandler,
+)
 from typing import Optional
 
+# Logger raiz da aplicação, configurado por setup_logger
+LOGGER_NAME = "InsiderCrypto"
+
 # Definindo nível customizado para ALERT
 ALERT_LEVEL = 35
-logging.addLevelName(ALERT_LEVEL, "ALERT")
+if logging.getLevelName(ALERT_LEVEL) != "ALERT":
+    logging.addLevelName(ALERT_LEVEL, "ALERT")
 
 class CustomLogger(logging.getLoggerClass()):
     """Logger customizado com método para alertas críticos"""
@@ -31,6 +52,29 @@ class CustomLogger(logging.getLoggerClass()):
         if self.isEnabledFor(ALERT_LEVEL):
             self._log(ALERT_LEVEL, msg, args, **kwargs)
 
+# Registrado na importação: loggers obtidos antes de setup_logger também têm alert()
+if logging.getLoggerClass() is not CustomLogger:
+    logging.setLoggerClass(CustomLogger)
+
+class CachedTimeFormatter(logging.Formatter):
+    """Formatter que reaproveita o asctime já formatado dentro do mesmo segundo"""
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._time_key = None
+        self._time_str = ""
+
+    def formatTime(self, record, datefmt: Optional[str] = None) -> str:
+        """Formata o horário apenas quando o segundo (ou o formato) muda"""
+        key = (int(record.created), datefmt)
+        if key != self._time_key:
+            ct = self.converter(key[0])
+            self._time_str = time.strftime(datefmt or self.default_time_format, ct)
+            self._time_key = key
+        if datefmt or not self.default_msec_format:
+            return self._time_str
+        return self.default_msec_format % (self._time_str, record.msecs)
+
 class ColorFormatter(logging.Formatter):
     """Formatador de log com saída colorida para console"""
 
@@ -44,78 +88,347 @@ class ColorFormatter(logging.Formatter):
     }
     RESET = "\033[0m"
 
+    def __init__(self, fmt: Optional[str] = None, datefmt: Optional[str] = None) -> None:
+        super().__init__(fmt, datefmt)
+        # Um Formatter por nível, montado uma única vez
+        self._formatters = {
+            level: CachedTimeFormatter(f"{color}{self._fmt}{self.RESET}", datefmt)
+            for level, color in self.COLORS.items()
+        }
+        self._default = CachedTimeFormatter(f"{self.RESET}{self._fmt}{self.RESET}", datefmt)
+
     def format(self, record) -> str:
         """Aplica formatação colorida baseada no nivel do log"""
-        color = self.COLORS.get(record.levelno, self.RESET)
-        fmt = f"{color}{self._fmt}{self.RESET}"
-        return logging.Formatter(fmt, self.datefmt).format(record)
-    
+        return self._formatters.get(record.levelno, self._default).format(record)
+
+class BufferedEmitMixin:
+    """
+    Acumula registros formatados em memória e grava em lote no arquivo
+
+    O buffer é descarregado ao atingir `capacity` registros, após
+    `flush_interval` segundos desde a última gravação ou imediatamente
+    para registros de nível >= `flush_level`.
+    """
+
+    def __init__(
+            self,
+            *args,
+            capacity: int = 512,
+            flush_interval: float = 1.0,
+            flush_level: int = logging.WARNING,
+            **kwargs
+    ) -> None:
+        self.capacity = capacity
+        self.flush_interval = flush_interval
+        self.flush_level = flush_level
+        self._buffer = []
+        self._last_flush = time.monotonic()
+        super().__init__(*args, **kwargs)
+
+    def emit(self, record) -> None:
+        """Formata o registro e o adiciona ao buffer"""
+        try:
+            if isinstance(self, BaseRotatingHandler) and self.shouldRollover(record):
+                self.flush()
+                self.doRollover()
+            self._buffer.append(self.format(record) + self.terminator)
+        except Exception:
+            self.handleError(record)
+            return
+
+        if (
+            len(self._buffer) >= self.capacity
+            or record.levelno >= self.flush_level
+            or time.monotonic() - self._last_flush >= self.flush_interval
+        ):
+            self.flush()
+
+    def flush(self) -> None:
+        """Grava o buffer pendente com uma única escrita no stream"""
+        self.acquire()
+        try:
+            pending = len(self._buffer)
+            try:
+                if self._buffer:
+                    if self.stream is None:
+                        self.stream = self._open()
+                    self.stream.write("".join(self._buffer))
+                super().flush()
+            except Exception:
+                # Como nos handlers da stdlib: reporta via handleError sem propagar,
+                # para não derrubar a thread do QueueListener. O lote é descartado.
+                self.handleError(logging.makeLogRecord({
+                    "msg": "Falha ao gravar %d registros em %s",
+                    "args": (pending, self.baseFilename),
+                }))
+            finally:
+                self._buffer.clear()
+                self._last_flush = time.monotonic()
+        finally:
+            self.release()
+
+    def close(self) -> None:
+        """Grava o buffer pendente antes de fechar o arquivo"""
+        self.flush()
+        super().close()
+
+class RepeatFilter(logging.Filter):
+    """
+    Suprime registros idênticos emitidos em sequência dentro de uma janela
+
+    Quando a sequência é quebrada, ou em `flush()` depois que a janela
+    expira, um registro de resumo no nível da sequência informa quantas
+    repetições foram descartadas (atributo `repeats`). Registros com
+    exc_info e os próprios resumos sempre passam.
+    """
+
+    def __init__(self, window: float = 2.0) -> None:
+        super().__init__()
+        self.window = window
+        self._last = None
+        self._pending = None
+        self._count = 0
+        self._last_time = 0.0
+        self._lock = threading.Lock()
+
+    def filter(self, record) -> bool:
+        """Retorna False para repetições do último registro emitido"""
+        if record.exc_info or hasattr(record, "repeats"):
+            # Cada traceback pode trazer informação nova; resumos já são únicos
+            return True
+        try:
+            key = (record.levelno, record.msg, record.args)
+            hash(key)
+        except TypeError:
+            # Argumentos não hasheáveis: não há como comparar, deixa passar
+            return True
+
+        now = time.monotonic()
+        with self._lock:
+            if key == self._last and now - self._last_time < self.window:
+                self._count += 1
+                self._pending = record
+                return False
+            summary = self._take_summary()
+            self._last = key
+            self._last_time = now
+        # O resumo sai antes do registro que quebrou a sequência
+        self._dispatch(summary)
+        return True
+
+    def flush(self, force: bool = False) -> None:
+        """Emite o resumo pendente se a janela expirou (ou sempre, com `force`)"""
+        with self._lock:
+            if not force and time.monotonic() - self._last_time < self.window:
+                return
+            summary = self._take_summary()
+        self._dispatch(summary)
+
+    def _take_summary(self) -> Optional[logging.LogRecord]:
+        """Monta o resumo a partir da última repetição suprimida e zera o contador"""
+        if not self._count:
+            return None
+        summary = logging.makeLogRecord(self._pending.__dict__)
+        try:
+            message = summary.getMessage()
+        except Exception:
+            message = str(summary.msg)
+        summary.msg = f"{message} (mais {self._count} repetições suprimidas)"
+        summary.args = None
+        summary.repeats = self._count
+        self._pending = None
+        self._count = 0
+        return summary
+
+    @staticmethod
+    def _dispatch(summary: Optional[logging.LogRecord]) -> None:
+        """Entrega o resumo pela mesma cadeia de handlers do logger de origem"""
+        if summary is not None:
+            logging.getLogger(summary.name).callHandlers(summary)
+
+class BufferedTimedRotatingFileHandler(BufferedEmitMixin, TimedRotatingFileHandler):
+    """TimedRotatingFileHandler com escrita em lote"""
+
+class BufferedFileHandler(BufferedEmitMixin, logging.FileHandler):
+    """FileHandler com escrita em lote"""
+
+def _start_periodic_flush(handlers, interval: float, filters=()) -> threading.Event:
+    """
+    Descarrega periodicamente os buffers dos handlers em uma thread daemon
+
+    Garante que registros de baixo volume não fiquem retidos por mais de
+    `interval` segundos e que o resumo de uma rajada seguida de silêncio
+    seja emitido pelos `filters` (RepeatFilter). Retorna o Event que
+    encerra a thread.
+    """
+    stop = threading.Event()
+
+    def _run() -> None:
+        while not stop.wait(interval):
+            for repeat_filter in filters:
+                repeat_filter.flush()
+            for handler in handlers:
+                try:
+                    handler.flush()
+                except Exception:
+                    # Uma falha em um handler não pode encerrar a thread
+                    handler.handleError(logging.makeLogRecord({"msg": "Falha no flush periódico"}))
+
+    threading.Thread(target=_run, name="log-flusher", daemon=True).start()
+    return stop
+
 def setup_logger(
-        name: str = "InsiderCrypto",
+        name: str = LOGGER_NAME,
         log_level: int = logging.INFO,
         log_dir: str = "logs",
-        alert_log: str = "alerts.log"
+        alert_log: str = "alerts.log",
+        syslog_address: Optional[str] = None
 ) -> logging.Logger:
     """
     Configura o sistema de loggin com handlers para console e arquivos
 
+    Os handlers de console e arquivo ficam em um QueueListener com thread
+    própria; o logger recebe apenas um QueueHandler.
+
     Args:
         name (str): Nome do logger principal
         log_level: Nível de log padrão
         log_dir: Diretório para armazenar arquivos de log
         alert_log: Nome do arquivo para alertas críticos
+        syslog_address: Socket do syslog (ex.: "/dev/log") para enviar os
+            alertas em vez de gravá-los em `alert_log`. Os alertas usam a
+            facility LOCAL0; para mantê-los em arquivo, configure no rsyslog
+            a regra `local0.* /var/log/insider_crypto/alerts.log`
 
     Returns:
         Logger configurado e pronto para uso
     """
-    # Configurar diretório de logs
-    Path(log_dir).mkdir(exist_ok=True)
-
-    # Registrar logger customizado
-    logging.setLoggerClass(CustomLogger)
     logger = logging.getLogger(name)
     logger.setLevel(log_level)
 
-    # Evitar registros duplicados
-    if logger.handlers:
+    # Já configurado: evita registros duplicados e a recriação dos handlers
+    if any(isinstance(h, QueueHandler) for h in logger.handlers):
         return logger
-    
+
+    # O formato não usa thread/processo/task: evita coletá-los em cada LogRecord
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    logging.logAsyncioTasks = False
+
+    # Configurar diretório de logs
+    Path(log_dir).mkdir(exist_ok=True)
+
     # Formatação padrão
     base_fmt = "%(asctime)s | %(name)s | %(levelname)s | %(module)s:%(lineno)d - %(message)s"
     date_fmt = "%Y-%m-%d %H:%M:%S"
 
-    # Handler para console com cores
+    # Handler para console, com cores apenas em terminal interativo (respeita NO_COLOR)
     console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setFormatter(ColorFormatter(base_fmt, date_fmt))
+    if sys.stdout.isatty() and not os.environ.get("NO_COLOR"):
+        console_handler.setFormatter(ColorFormatter(base_fmt, date_fmt))
+    else:
+        console_handler.setFormatter(CachedTimeFormatter(base_fmt, date_fmt))
 
-    # Handler para arquivo principal com rotação diária
-    main_handler = TimedRotatingFileHandler(
+    # Handler para arquivo principal com rotação diária e escrita em lote
+    main_handler = BufferedTimedRotatingFileHandler(
         filename=os.path.join(log_dir, "main.log"),
         when="midnight",
         backupCount=7,
-        encoding="utf-8"
+        encoding="utf-8",
+        delay=True
     )
-    main_handler.setFormatter(logging.Formatter(base_fmt, date_fmt))
+    main_handler.setFormatter(CachedTimeFormatter(base_fmt, date_fmt))
 
     # handler especial para alertas
-    alert_handler = logging.FileHandler(
-        filename=os.path.join(log_dir, alert_log),
-        mode="a",
-        encoding="utf-8"
-    )
+    if syslog_address:
+        # O buffer do socket absorve rajadas de alertas sem bloquear a escrita
+        alert_handler = SysLogHandler(address=syslog_address, facility=SysLogHandler.LOG_LOCAL0)
+        alert_handler.priority_map = {**SysLogHandler.priority_map, "ALERT": "alert"}
+        alert_handler.setFormatter(CachedTimeFormatter(f"insider_crypto: {base_fmt}", date_fmt))
+    else:
+        # Gravados em lote (CRITICAL força a gravação); o arquivo só é aberto no primeiro alerta
+        alert_handler = BufferedFileHandler(
+            filename=os.path.join(log_dir, alert_log),
+            mode="a",
+            encoding="utf-8",
+            delay=True,
+            flush_level=logging.CRITICAL
+        )
+        alert_handler.setFormatter(CachedTimeFormatter(base_fmt, date_fmt))
     alert_handler.setLevel(ALERT_LEVEL)
-    alert_handler.setFormatter(logging.Formatter(base_fmt, date_fmt))
 
-    # Adicionar handlers ao logger
-    logger.addHandler(console_handler)
-    logger.addHandler(main_handler)
-    logger.addHandler(alert_handler)
+    # O logger só enfileira registros; a escrita real acontece na thread do listener
+    log_queue = queue.Queue(-1)
+    queue_handler = QueueHandler(log_queue)
+    # Rajadas da mesma mensagem viram um registro e um resumo. No handler, e não
+    # no logger, o filtro também vale para os registros propagados dos filhos
+    repeat_filter = RepeatFilter()
+    queue_handler.addFilter(repeat_filter)
+    logger.addHandler(queue_handler)
+    listener = QueueListener(
+        log_queue,
+        console_handler,
+        main_handler,
+        alert_handler,
+        respect_handler_level=True
+    )
+    listener.start()
+    logger._listener = listener
+
+    # Limita o tempo que registros ficam retidos nos buffers de arquivo
+    buffered = [h for h in (main_handler, alert_handler) if isinstance(h, BufferedEmitMixin)]
+    stop_flusher = _start_periodic_flush(buffered, interval=1.0, filters=[repeat_filter])
+    logger._flush_stop = stop_flusher
+
+    # Garante que os registros pendentes sejam gravados no encerramento
+    logger._shutdown_hook = functools.partial(shutdown_logger, logger)
+    atexit.register(logger._shutdown_hook)
 
     return logger
 
+def shutdown_logger(logger: logging.Logger) -> None:
+    """
+    Desfaz a configuração criada por setup_logger
+
+    Emite os resumos de repetição pendentes, para a thread de flush e o
+    listener (gravando o que restar na fila), fecha os handlers e remove o
+    QueueHandler do logger. Chamadas repetidas não têm efeito.
+
+    Args:
+        logger: Logger retornado por setup_logger
+    """
+    listener = getattr(logger, "_listener", None)
+    if listener is None:
+        return
+    atexit.unregister(logger._shutdown_hook)
+    logger._flush_stop.set()
+
+    queue_handlers = [
+        h for h in logger.handlers
+        if isinstance(h, QueueHandler) and h.queue is listener.queue
+    ]
+    for handler in queue_handlers:
+        for log_filter in handler.filters:
+            if isinstance(log_filter, RepeatFilter):
+                log_filter.flush(force=True)
+
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+    for handler in queue_handlers:
+        logger.removeHandler(handler)
+        handler.close()
+    del logger._listener, logger._flush_stop, logger._shutdown_hook
+
+@functools.lru_cache(maxsize=128)
 def get_logger(name: Optional[str] = None) -> logging.Logger:
-    """Retorna um logger configurado apropriadamente"""
-    return logging.getLogger(name or "InsiderCrypto")
+    """Retorna um logger configurado apropriadamente, aninhado sob LOGGER_NAME"""
+    if not name or name == LOGGER_NAME:
+        return logging.getLogger(LOGGER_NAME)
+    if not name.startswith(LOGGER_NAME + "."):
+        name = f"{LOGGER_NAME}.{name}"
+    return logging.getLogger(name)
 
 # Exemplo de uso
 if __name__ == "__main__":
@@ -1,5 +1,8 @@
+from dataclasses import dataclass
+
+
+@dataclass(slots=True, frozen=True)
 class Memecoin:
-    def __init__(self, name, price, volume):
-        self.name = name
-        self.price = price
-        self.volume = volume
\ No newline at end of file
+    name: str
+    price: float
+    volume: float
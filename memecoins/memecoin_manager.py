@@ -1,7 +1,74 @@
+import numpy as np
+
+from memecoins.memecoin import Memecoin
+
+
 class MemecoinManager:
-    def __init__(self):
-        self.memecoins = []
+    def __init__(self, capacity=64):
+        self.memecoins: list[Memecoin] = []
+        # Colunas numéricas (SoA) espelhando self.memecoins, para filtros vetorizados
+        self._prices = np.zeros(capacity, dtype=np.float32)
+        self._volumes = np.zeros(capacity, dtype=np.float32)
+        self._index = {}
+
+    @property
+    def prices(self):
+        return self._prices[:len(self.memecoins)]
+
+    @property
+    def volumes(self):
+        return self._volumes[:len(self.memecoins)]
+
+    def add_memecoin(self, memecoin):
+        # Converte antes de registrar: um valor inválido não deixa linha órfã
+        price, volume = float(memecoin.price), float(memecoin.volume)
+        row = self._store(memecoin)
+        self._prices[row] = price
+        self._volumes[row] = volume
+
+    def bulk_add(self, memecoins):
+        # Converte o lote inteiro antes de registrar qualquer moeda
+        batch = list(memecoins)
+        if not batch:
+            return
+        prices = np.fromiter((float(m.price) for m in batch), dtype=np.float32, count=len(batch))
+        volumes = np.fromiter((float(m.volume) for m in batch), dtype=np.float32, count=len(batch))
+        # Linha -> posição da última ocorrência no lote, gravando as colunas de uma só vez
+        last = {self._store(m): i for i, m in enumerate(batch)}
+        rows = np.fromiter(last, dtype=np.intp, count=len(last))
+        positions = np.fromiter(last.values(), dtype=np.intp, count=len(last))
+        self._prices[rows] = prices[positions]
+        self._volumes[rows] = volumes[positions]
+
+    def select_high_volume(self, threshold):
+        # Máscara booleana alinhada com self.memecoins
+        return self.volumes >= threshold
+
+    def _store(self, memecoin):
+        row = self._index.get(memecoin.name)
+        if row is None:
+            row = len(self.memecoins)
+            if row == len(self._prices):
+                self._grow()
+            self._index[memecoin.name] = row
+            self.memecoins.append(memecoin)
+        else:
+            # Moeda já monitorada: atualiza a linha existente
+            self.memecoins[row] = memecoin
+        return row
+
+    def _grow(self):
+        capacity = max(1, 2 * len(self._prices))
+        self._prices = self._resized(self._prices, capacity)
+        self._volumes = self._resized(self._volumes, capacity)
+
+    @staticmethod
+    def _resized(column, capacity):
+        # Diferente de np.resize, completa com zeros em vez de repetir os dados
+        grown = np.zeros(capacity, dtype=column.dtype)
+        grown[:len(column)] = column
+        return grown
 
     def filter_memecoins(self):
         # Lógica para filtrar memecoins promissoras
-        pass
\ No newline at end of file
+        pass
@@ -1,15 +1,21 @@
+# Templates compilados uma única vez no import
+_SIGNAL_FMT = (
+    "\n"
+    "    🚨 *ALERTA DE TRADING* 🚨\n"
+    "    • Moeda: %s\n"
+    "    • Preço Atual: $%.2f\n"
+    "    • Horário: %s\n"
+    "    • Ação Recomendada: %s\n"
+    "    • _Análise automática gerada pelo robô_\n"
+    "    "
+)
+_ALERT_FMT = "Alerta: %s %s!"
+
 def generate_signal_message(symbol, price, time, action):
-    return f"""
-    🚨 *ALERTA DE TRADING* 🚨
-    • Moeda: {symbol}
-    • Preço Atual: ${price:.2f}
-    • Horário: {time}
-    • Ação Recomendada: {action}
-    • _Análise automática gerada pelo robô_
-    """
+    return _SIGNAL_FMT % (symbol, price, time, action)
 
 
-    # class MessageTemplates:
-    # @staticmethod
-    # def alert_template(memecoin, action):
-    #     return f"Alerta: {action} {memecoin.name}!"
\ No newline at end of file
+class MessageTemplates:
+    @staticmethod
+    def alert_template(memecoin, action):
+        return _ALERT_FMT % (action, memecoin.name)
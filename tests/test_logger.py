@@ -1,26 +1,338 @@
 # tests/test_logger.py
+import logging
+import queue
+import socket
 import sys
+import threading
 import os
+from logging.handlers import BufferingHandler, QueueHandler, QueueListener
+
+import pytest
 
 # Adiciona o diretório raiz ao Python path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 # Importa o logger configurado
-from logger.log_config import setup_logger, get_logger
-
-# Configura o logger
-logger = setup_logger(log_level="INFO")
-
-# Testa os diferentes níveis de log
-logger.debug("Esta é uma mensagem de DEBUG")  # Não deve aparecer (nível INFO)
-logger.info("Esta é uma mensagem de INFO")
-logger.warning("Esta é uma mensagem de WARNING")
-logger.alert("Esta é uma mensagem de ALERT")
-logger.error("Esta é uma mensagem de ERROR")
-logger.critical("Esta é uma mensagem de CRITICAL")
-
-# Teste com exceções (opcional)
-try:
-    1 / 0  # Gera uma exceção
-except ZeroDivisionError as e:
-    logger.error(f"Erro ao dividir por zero: {e}", exc_info=True)
\ No newline at end of file
+from logger.log_config import (
+    ALERT_LEVEL,
+    BufferedFileHandler,
+    CachedTimeFormatter,
+    CustomLogger,
+    RepeatFilter,
+    get_logger,
+    setup_logger,
+    shutdown_logger,
+)
+
+# Níveis exercitados pelo teste (DEBUG não deve aparecer no nível INFO)
+NIVEIS = [
+    (logging.DEBUG, "DEBUG"),
+    (logging.INFO, "INFO"),
+    (logging.WARNING, "WARNING"),
+    (ALERT_LEVEL, "ALERT"),
+    (logging.ERROR, "ERROR"),
+    (logging.CRITICAL, "CRITICAL"),
+]
+
+def test_levels_emitted(caplog):
+    # Logger isolado, sem handlers de arquivo: os registros ficam só em memória
+    logger = CustomLogger("InsiderCrypto.teste_niveis", logging.INFO)
+    logger.addHandler(caplog.handler)
+
+    # Testa os diferentes níveis de log (métodos resolvidos uma única vez)
+    is_enabled, log = logger.isEnabledFor, logger.log
+    for nivel, nome in NIVEIS:
+        if is_enabled(nivel):
+            log(nivel, "Esta é uma mensagem de %s", nome)
+    logger.alert("Alerta via CustomLogger.alert")
+
+    # Teste com exceções
+    try:
+        1 / 0  # Gera uma exceção
+    except ZeroDivisionError as e:
+        if logger.isEnabledFor(logging.ERROR):
+            logger.error("Erro ao dividir por zero: %s", e, exc_info=e)
+
+    niveis = {r.levelname for r in caplog.records}
+    assert niveis == {"INFO", "WARNING", "ALERT", "ERROR", "CRITICAL"}
+    assert caplog.records[-1].exc_info[0] is ZeroDivisionError
+    assert "Alerta via CustomLogger.alert" in caplog.messages
+
+@pytest.fixture
+def criar_logger(monkeypatch):
+    """Chama setup_logger e encerra, no teardown, cada logger criado"""
+    for flag in ("logThreads", "logProcesses", "logMultiprocessing", "logAsyncioTasks"):
+        monkeypatch.setattr(logging, flag, getattr(logging, flag, True), raising=False)
+    criados = []
+
+    def criar(name, **kwargs):
+        logger = setup_logger(name=name, **kwargs)
+        criados.append(logger)
+        return logger
+
+    yield criar
+
+    for logger in criados:
+        shutdown_logger(logger)
+
+def test_log_files_written(tmp_path, criar_logger):
+    logger = criar_logger("InsiderCrypto.teste_arquivos", log_dir=str(tmp_path))
+    logger.info("Mensagem para o arquivo principal")
+    logger.alert("Mensagem para o arquivo de alertas")
+
+    # Aguarda o listener processar a fila e descarrega os buffers
+    listener = logger._listener
+    listener.queue.join()
+    for handler in listener.handlers:
+        handler.flush()
+
+    main_log = (tmp_path / "main.log").read_text(encoding="utf-8")
+    alert_log = (tmp_path / "alerts.log").read_text(encoding="utf-8")
+    assert "Mensagem para o arquivo principal" in main_log
+    assert "Mensagem para o arquivo de alertas" in main_log
+    assert "Mensagem para o arquivo de alertas" in alert_log
+    assert "Mensagem para o arquivo principal" not in alert_log
+
+def test_shutdown_logger(tmp_path, criar_logger):
+    logger = criar_logger("InsiderCrypto.teste_shutdown", log_dir=str(tmp_path))
+    listener = logger._listener
+    logger.info("Mensagem antes do shutdown")
+    for _ in range(3):
+        logger.alert("Alerta repetido")
+
+    shutdown_logger(logger)
+
+    # O resumo pendente e a fila foram gravados antes de fechar os arquivos
+    alert_log = (tmp_path / "alerts.log").read_text(encoding="utf-8")
+    assert "Alerta repetido (mais 2 repetições suprimidas)" in alert_log
+    assert "Mensagem antes do shutdown" in (tmp_path / "main.log").read_text(encoding="utf-8")
+    assert listener._thread is None
+    assert not any(isinstance(h, QueueHandler) for h in logger.handlers)
+    assert not hasattr(logger, "_listener")
+
+    # Segunda chamada (teardown da fixture) não tem efeito
+    shutdown_logger(logger)
+
+def test_get_logger_obtido_antes_do_setup(tmp_path, criar_logger):
+    # Como no nível do módulo: obtido antes de setup_logger
+    filho = get_logger("teste.modulo_importado")
+    assert filho.name == "InsiderCrypto.teste.modulo_importado"
+    assert isinstance(filho, CustomLogger)
+    assert get_logger("InsiderCrypto.teste.modulo_importado") is filho
+
+    logger = criar_logger("InsiderCrypto", log_dir=str(tmp_path))
+    assert filho.hasHandlers()
+    for _ in range(3):
+        filho.alert("Alerta do módulo")
+    filho.info("Info do módulo")  # quebra a sequência e libera o resumo
+
+    listener = logger._listener
+    listener.queue.join()
+    for handler in listener.handlers:
+        handler.flush()
+
+    main_log = (tmp_path / "main.log").read_text(encoding="utf-8")
+    alert_log = (tmp_path / "alerts.log").read_text(encoding="utf-8")
+    assert "Info do módulo" in main_log
+    assert "Alerta do módulo (mais 2 repetições suprimidas)" in alert_log
+
+@pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="requer sockets Unix")
+def test_alertas_vao_para_o_syslog(tmp_path, criar_logger):
+    # Servidor syslog falso: socket datagrama Unix no diretório temporário
+    servidor = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+    servidor.bind(str(tmp_path / "log.sock"))
+    servidor.settimeout(2.0)
+    try:
+        logger = criar_logger(
+            "InsiderCrypto.teste_syslog",
+            log_dir=str(tmp_path),
+            syslog_address=str(tmp_path / "log.sock"),
+        )
+        logger.info("Mensagem que não vai para o syslog")
+        logger.alert("Alerta de %s", "BONK")
+        logger._listener.queue.join()
+
+        datagrama = servidor.recv(4096)
+        # LOCAL0 (16) * 8 + alert (1)
+        assert datagrama.startswith(b"<129>insider_crypto: ")
+        assert b"| ALERT |" in datagrama
+        assert b"Alerta de BONK" in datagrama
+
+        # O registro INFO é filtrado pelo nível do handler
+        servidor.setblocking(False)
+        with pytest.raises(BlockingIOError):
+            servidor.recv(4096)
+        assert not (tmp_path / "alerts.log").exists()
+    finally:
+        servidor.close()
+
+def test_cached_time_formatter_igual_ao_padrao():
+    for date_fmt in (None, "%Y-%m-%d %H:%M:%S"):
+        cached = CachedTimeFormatter("%(asctime)s - %(message)s", date_fmt)
+        padrao = logging.Formatter("%(asctime)s - %(message)s", date_fmt)
+        for created in (1000.123, 1000.9, 1001.5, 5000.0):
+            record = logging.makeLogRecord({"msg": "m", "created": created, "msecs": (created % 1) * 1000})
+            assert cached.format(record) == padrao.format(record)
+
+class _StreamCheio:
+    """Stream que simula disco cheio em toda escrita"""
+    def write(self, data):
+        raise OSError(28, "No space left on device")
+
+    def flush(self):
+        pass
+
+    def close(self):
+        pass
+
+def test_falha_de_escrita_nao_derruba_listener(tmp_path, capsys):
+    falho = BufferedFileHandler(str(tmp_path / "falho.log"), delay=True)
+    falho.stream = _StreamCheio()
+    saudavel = BufferingHandler(100)
+    log_queue = queue.Queue(-1)
+    listener = QueueListener(log_queue, falho, saudavel)
+    listener.start()
+    try:
+        logger = CustomLogger("InsiderCrypto.teste_falha")
+        logger.addHandler(QueueHandler(log_queue))
+        logger.warning("primeiro")  # WARNING força o flush, que falha
+        logger.warning("segundo")
+        log_queue.join()
+
+        assert listener._thread.is_alive()
+        assert [r.getMessage() for r in saudavel.buffer] == ["primeiro", "segundo"]
+        assert falho._buffer == []  # o lote que falhou não é reenviado
+        assert "No space left on device" in capsys.readouterr().err
+    finally:
+        listener.stop()
+        falho.stream = None
+        falho.close()
+
+LOGGER_REPETICOES = "InsiderCrypto.teste_repeticoes"
+
+def _registro(msg, *args, levelno=logging.INFO, exc_info=None):
+    return logging.makeLogRecord({
+        "name": LOGGER_REPETICOES,
+        "msg": msg,
+        "args": args,
+        "levelno": levelno,
+        "levelname": logging.getLevelName(levelno),
+        "exc_info": exc_info,
+    })
+
+@pytest.fixture
+def repeticoes():
+    """Logger com RepeatFilter e um handler que guarda os registros entregues"""
+    logger = logging.getLogger(LOGGER_REPETICOES)
+    logger.propagate = False
+    capturados = BufferingHandler(10_000)
+    repeat = RepeatFilter(window=60.0)
+    logger.addHandler(capturados)
+    logger.addFilter(repeat)
+    yield logger, repeat, capturados.buffer
+    logger.removeFilter(repeat)
+    logger.removeHandler(capturados)
+    logger.propagate = True
+
+def test_repeat_filter_resumo_ao_quebrar_sequencia(repeticoes):
+    logger, _, entregues = repeticoes
+    for _ in range(3):
+        logger.handle(_registro("preço %s", "BONK"))
+    # Mesmo texto em outro nível não é repetição
+    logger.handle(_registro("preço %s", "BONK", levelno=logging.WARNING))
+    logger.handle(_registro("preço %s", "WIF"))
+
+    assert [(r.levelno, r.getMessage()) for r in entregues] == [
+        (logging.INFO, "preço BONK"),
+        (logging.INFO, "preço BONK (mais 2 repetições suprimidas)"),
+        (logging.WARNING, "preço BONK"),
+        (logging.INFO, "preço WIF"),
+    ]
+
+def test_repeat_filter_resumo_no_nivel_da_sequencia(repeticoes):
+    logger, _, entregues = repeticoes
+    for _ in range(5):
+        logger.handle(_registro("dup alert", levelno=ALERT_LEVEL))
+    logger.handle(_registro("after dups"))
+
+    assert [(r.levelname, r.getMessage()) for r in entregues] == [
+        ("ALERT", "dup alert"),
+        ("ALERT", "dup alert (mais 4 repetições suprimidas)"),
+        ("INFO", "after dups"),
+    ]
+
+def test_repeat_filter_resumo_no_flush(repeticoes):
+    logger, repeat, entregues = repeticoes
+    for _ in range(3):
+        logger.handle(_registro("volume"))
+
+    # Janela ainda aberta: a sequência pode continuar
+    repeat.flush()
+    assert len(entregues) == 1
+
+    # Rajada seguida de silêncio: o resumo sai no flush periódico
+    repeat.window = 0.0
+    repeat.flush()
+    repeat.flush()
+    assert [r.getMessage() for r in entregues] == [
+        "volume",
+        "volume (mais 2 repetições suprimidas)",
+    ]
+
+def test_repeat_filter_janela_expirada():
+    repeat = RepeatFilter(window=0.0)
+    assert repeat.filter(_registro("volume"))
+    assert repeat.filter(_registro("volume"))
+
+def test_repeat_filter_args_nao_hasheaveis_passam():
+    repeat = RepeatFilter(window=60.0)
+    assert repeat.filter(_registro("dados %s", ["BONK"]))
+    assert repeat.filter(_registro("dados %s", ["BONK"]))
+
+def test_repeat_filter_nao_suprime_excecoes():
+    repeat = RepeatFilter(window=60.0)
+    try:
+        1 / 0
+    except ZeroDivisionError:
+        exc_info = sys.exc_info()
+    assert repeat.filter(_registro("falha", levelno=logging.ERROR, exc_info=exc_info))
+    assert repeat.filter(_registro("falha", levelno=logging.ERROR, exc_info=exc_info))
+
+def test_repeat_filter_entre_threads(repeticoes):
+    logger, _, entregues = repeticoes
+    inicio = threading.Barrier(8)
+
+    def emitir():
+        inicio.wait()
+        for _ in range(1000):
+            logger.handle(_registro("volume"))
+
+    threads = [threading.Thread(target=emitir) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    logger.handle(_registro("fim"))
+
+    # Só o primeiro passa; o resumo não perde nenhuma repetição
+    assert [r.getMessage() for r in entregues] == [
+        "volume",
+        "volume (mais 7999 repetições suprimidas)",
+        "fim",
+    ]
+
+def test_alertas_repetidos_resumidos_no_arquivo_de_alertas(tmp_path, criar_logger):
+    logger = criar_logger("InsiderCrypto.teste_resumo", log_dir=str(tmp_path))
+    for _ in range(5):
+        logger.alert("dup alert")
+    logger.info("after dups")
+
+    listener = logger._listener
+    listener.queue.join()
+    for handler in listener.handlers:
+        handler.flush()
+
+    alert_log = (tmp_path / "alerts.log").read_text(encoding="utf-8")
+    assert alert_log.count("dup alert") == 2
+    assert "dup alert (mais 4 repetições suprimidas)" in alert_log
+    assert "after dups" not in alert_log
@@ -0,0 +1,59 @@
+import unittest
+from memecoins.memecoin import Memecoin
+from memecoins.memecoin_manager import MemecoinManager
+
+class TestMemecoinManager(unittest.TestCase):
+    def test_add_memecoin_preenche_colunas(self):
+        manager = MemecoinManager(capacity=1)
+        manager.add_memecoin(Memecoin("BONK", 0.5, 1_500_000))
+        manager.add_memecoin(Memecoin("WIF", 2.0, 300_000))
+
+        self.assertEqual(len(manager.memecoins), 2)
+        self.assertEqual(manager.prices.tolist(), [0.5, 2.0])
+        self.assertEqual(manager.volumes.tolist(), [1_500_000, 300_000])
+
+    def test_add_memecoin_atualiza_existente(self):
+        manager = MemecoinManager()
+        manager.add_memecoin(Memecoin("BONK", 0.5, 1_000))
+        manager.add_memecoin(Memecoin("BONK", 0.75, 2_000))
+
+        self.assertEqual(len(manager.memecoins), 1)
+        self.assertEqual(manager.prices.tolist(), [0.75])
+        self.assertEqual(manager.volumes.tolist(), [2_000])
+
+    def test_add_memecoin_invalido_nao_registra(self):
+        manager = MemecoinManager()
+        manager.add_memecoin(Memecoin("BONK", 0.5, 1_000))
+        with self.assertRaises(ValueError):
+            manager.add_memecoin(Memecoin("WIF", "n/a", 5))
+
+        self.assertEqual([m.name for m in manager.memecoins], ["BONK"])
+        self.assertNotIn("WIF", manager._index)
+        self.assertEqual(manager.prices.tolist(), [0.5])
+
+    def test_bulk_add_e_select_high_volume(self):
+        manager = MemecoinManager(capacity=2)
+        manager.bulk_add([
+            Memecoin("BONK", 0.5, 1_500_000),
+            Memecoin("WIF", 2.0, 300_000),
+            Memecoin("POPCAT", 1.0, 2_000_000),
+            Memecoin("WIF", 2.5, 900_000),
+        ])
+
+        self.assertEqual([m.name for m in manager.memecoins], ["BONK", "WIF", "POPCAT"])
+        self.assertEqual(manager.prices.tolist(), [0.5, 2.5, 1.0])
+        self.assertEqual(manager.select_high_volume(1_000_000).tolist(), [True, False, True])
+
+    def test_bulk_add_invalido_nao_altera_estado(self):
+        manager = MemecoinManager(capacity=1)
+        manager.add_memecoin(Memecoin("BONK", 0.5, 1_000))
+        with self.assertRaises(ValueError):
+            manager.bulk_add([
+                Memecoin("WIF", 2.0, 300_000),
+                Memecoin("BONK", 0.9, 2_000),
+                Memecoin("POPCAT", "n/a", 5),
+            ])
+
+        self.assertEqual([m.name for m in manager.memecoins], ["BONK"])
+        self.assertEqual(manager.prices.tolist(), [0.5])
+        self.assertEqual(manager.volumes.tolist(), [1_000])
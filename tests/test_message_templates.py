@@ -0,0 +1,15 @@
+import unittest
+from memecoins.memecoin import Memecoin
+from messaging.message_templates import MessageTemplates, generate_signal_message
+
+class TestMessageTemplates(unittest.TestCase):
+    def test_generate_signal_message(self):
+        message = generate_signal_message("BONK", 0.126, "12:00", "COMPRAR")
+        self.assertIn("• Moeda: BONK\n", message)
+        self.assertIn("• Preço Atual: $0.13\n", message)
+        self.assertIn("• Horário: 12:00\n", message)
+        self.assertIn("• Ação Recomendada: COMPRAR\n", message)
+
+    def test_alert_template(self):
+        memecoin = Memecoin("BONK", 0.5, 1_000)
+        self.assertEqual(MessageTemplates.alert_template(memecoin, "COMPRAR"), "Alerta: COMPRAR BONK!")